@@ -1,12 +1,131 @@
 from langchain.chat_models      import init_chat_model
 from langchain_core.runnables   import Runnable
 
-from config.setup import (GROQ_API_KEY1, GROQ_API_KEY2, GROQ_API_KEY3, GROQ_API_KEY4, 
+from config.setup import (GROQ_API_KEY1, GROQ_API_KEY2, GROQ_API_KEY3, GROQ_API_KEY4,
                           OPENAI_API_KEY, LLM_SEMAPHORE, LLM_SEMAPHORE_SYNC)
 
-import groq 
+from collections import defaultdict, deque
+from time        import monotonic
+
+import asyncio
+import groq
 import openai
 
+# Shared aiohttp-backed async HTTP client for the Groq models, improves
+# connection-pool efficiency under many concurrent calls. Falls back to the
+# default httpx client when the groq[aiohttp] extra is not installed.
+try:
+    from groq import DefaultAioHttpClient
+    _GROQ_ASYNC_HTTP_CLIENT = DefaultAioHttpClient()
+except ImportError:
+    _GROQ_ASYNC_HTTP_CLIENT = None
+
+
+class RateLimiter:
+    """
+    Token-bucket style rate limiter shared across async LLM calls.
+    Tracks the timestamps of recent calls per LLM instance and only blocks a
+    caller when that instance is at its requests-per-minute budget, instead
+    of sleeping a fixed amount after every call.
+    """
+
+    def __init__(self, rpm: int = 25):
+        """
+        Args:
+            rpm: Allowed requests per minute for each LLM instance.
+        """
+        self._rpm = rpm
+        self._calls = defaultdict(deque)
+        self._lock = asyncio.Lock()
+
+    async def wait(self, model_key):
+        """
+        Block until a call slot is available for the given model.
+
+        Args:
+            model_key: Identifier of the LLM instance about to be invoked,
+                e.g. id(llm). RPM budgets are per API key, so instances of
+                the same model under different keys must not share a bucket.
+        """
+        while True:
+            async with self._lock:
+                now = monotonic()
+                calls = self._calls[model_key]
+
+                # Drop timestamps older than the 60s window
+                while calls and now - calls[0] >= 60:
+                    calls.popleft()
+
+                if len(calls) < self._rpm:
+                    calls.append(now)
+                    return
+
+                # Bucket is full, wait until the oldest call leaves the window
+                delay = 60 - (now - calls[0])
+            await asyncio.sleep(delay)
+
+
+class LLMHealthTracker:
+    """
+    Tracks which LLMs recently succeeded or failed so fallback loops can try
+    the last known-good model first and skip models that are cooling down,
+    instead of burning a failed round-trip per article during an incident.
+    """
+
+    def __init__(self, max_cooldown: float = 300.0):
+        """
+        Args:
+            max_cooldown: Upper bound on the per-model cooldown in seconds.
+        """
+        self._max_cooldown = max_cooldown
+        self._preferred = None
+        self._cooldowns = {}
+        self._fails = defaultdict(int)
+
+    def order(self, llms):
+        """
+        Order the LLMs with the preferred model first, skipping models that
+        are still cooling down after a failure.
+
+        Args:
+            llms: The LLM instances to order.
+
+        Returns:
+            A list of LLM instances to try, in preference order.
+        """
+        now = monotonic()
+        available = [
+            llm for llm in llms
+            if self._cooldowns.get(id(llm), 0) <= now
+        ]
+
+        # Everything is cooling down, fall back to the raw order
+        if not available:
+            return list(llms)
+
+        available.sort(key=lambda llm: id(llm) != self._preferred)
+        return available
+
+    def record_success(self, llm):
+        """Mark an LLM instance healthy, reset its breaker, and prefer it for subsequent calls."""
+        self._preferred = id(llm)
+        self._fails.pop(id(llm), None)
+        self._cooldowns.pop(id(llm), None)
+
+    def record_failure(self, llm):
+        """
+        Put an LLM instance on cooldown after a failed call. Consecutive
+        failures grow the cooldown exponentially (2, 4, 8, ... seconds up to
+        max_cooldown), so a provider that is down stops being retried on
+        every article. State is per instance since each API key fails and
+        recovers independently of its siblings running the same model.
+        """
+        self._fails[id(llm)] += 1
+        cooldown = min(self._max_cooldown, 2 ** self._fails[id(llm)])
+        self._cooldowns[id(llm)] = monotonic() + cooldown
+        if self._preferred == id(llm):
+            self._preferred = None
+
 
 class LLMCollection:
     """
@@ -28,64 +147,81 @@ class LLMCollection:
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY1
+                    api_key=GROQ_API_KEY1,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ),
                 init_chat_model(
                    "llama-3.3-70b-versatile",
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY1
+                    api_key=GROQ_API_KEY1,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ),
                 init_chat_model(
                    "llama3-70b-8192",
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY2
+                    api_key=GROQ_API_KEY2,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ),
                 init_chat_model(
                    "llama-3.3-70b-versatile",
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY2
+                    api_key=GROQ_API_KEY2,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ), 
                 init_chat_model(
                    "llama3-70b-8192",
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY3
+                    api_key=GROQ_API_KEY3,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ),
                 init_chat_model(
                    "llama-3.3-70b-versatile",
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY3
+                    api_key=GROQ_API_KEY3,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ), 
                 init_chat_model(
                    "llama3-70b-8192",
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY4
+                    api_key=GROQ_API_KEY4,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ),
                 init_chat_model(
                    "llama-3.3-70b-versatile",
                     model_provider="groq",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=GROQ_API_KEY4
+                    api_key=GROQ_API_KEY4,
+                    http_async_client=_GROQ_ASYNC_HTTP_CLIENT,
+                    model_kwargs={"response_format": {"type": "json_object"}}
                 ), 
                 init_chat_model(
                    "gpt-4.1-mini",
                     model_provider="openai",
                     temperature=0.2,
                     max_retries=3,
-                    api_key=OPENAI_API_KEY
-                ), 
+                    api_key=OPENAI_API_KEY,
+                    model_kwargs={"response_format": {"type": "json_object"}}
+                ),
             ]
         return cls._instance
 
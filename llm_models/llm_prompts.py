@@ -33,7 +33,49 @@ class DimensionClassification(BaseModel):
     sustainability: Optional[int] = Field(description="Sustainability score (0-2)", default=0)
 
 
-class ClassifierPrompts: 
+# Fused schema covering the score and every classification in one response
+class CombinedArticleAnalysis(DimensionClassification):
+    score: int = Field(description="Score of article summary")
+    tags: List[str] = Field(description="List of relevant tags for the article")
+    tickers: List[str] = Field(description="List of stock tickers mentioned in the article")
+    subsector: List[str] = Field(description="Primary subsector classification")
+    sentiment: str = Field(description="Sentiment classification (Bullish, Bearish, Neutral)")
+
+
+# Batch variants of the classification schemas, each item carries the id of
+# the article it belongs to within the submitted batch
+class TagsBatchItem(TagsClassification):
+    id: int = Field(description="Id of the article within the batch")
+
+class TickersBatchItem(TickersClassification):
+    id: int = Field(description="Id of the article within the batch")
+
+class SubsectorBatchItem(SubsectorClassification):
+    id: int = Field(description="Id of the article within the batch")
+
+class SentimentBatchItem(SentimentClassification):
+    id: int = Field(description="Id of the article within the batch")
+
+class DimensionBatchItem(DimensionClassification):
+    id: int = Field(description="Id of the article within the batch")
+
+class TagsBatchClassification(BaseModel):
+    results: List[TagsBatchItem] = Field(description="One tags classification per article in the batch")
+
+class TickersBatchClassification(BaseModel):
+    results: List[TickersBatchItem] = Field(description="One tickers classification per article in the batch")
+
+class SubsectorBatchClassification(BaseModel):
+    results: List[SubsectorBatchItem] = Field(description="One subsector classification per article in the batch")
+
+class SentimentBatchClassification(BaseModel):
+    results: List[SentimentBatchItem] = Field(description="One sentiment classification per article in the batch")
+
+class DimensionBatchClassification(BaseModel):
+    results: List[DimensionBatchItem] = Field(description="One dimension classification per article in the batch")
+
+
+class ClassifierPrompts:
     """
     Centralized prompt templates for better readability and maintenance.
     """
@@ -190,6 +232,66 @@ class ClassifierPrompts:
             {format_instructions} 
         """
     
+    @staticmethod
+    def get_combined_prompt():
+        return """You are an expert financial analyst for Indonesia Stock Market (IDX) news articles.
+            Your task is to score AND classify the article in a single pass, following every rule below.
+
+            Article Title:
+            {title}
+
+            Article Content:
+            {body}
+
+            1. Score ('score'):
+            - Score the article based on the following 'Scoring Criteria'.
+
+            Scoring Criteria:
+            {criteria}
+
+            2. Tags ('tags'):
+            - Identify AT MOST 5 relevant tags, ONLY from this list of available tags: {tags}.
+            - Do not create, modify, or infer new tags.
+
+            3. Tickers ('tickers'):
+            - Identify the stock tickers explicitly mentioned in the article, matched against this list of available tickers: {tickers}.
+            - Do not modify, infer, or abbreviate ticker symbols.
+
+            4. Subsector ('subsector'):
+            - Identify the ONE most relevant subsector from this list of available subsectors: {subsectors}.
+            - Return an empty string when no subsector applies.
+
+            5. Sentiment ('sentiment'):
+            - Classify the sentiment as Bullish, Bearish, or Neutral from the perspective of Indonesia's stock investors.
+
+            6. Dimensions:
+            - Score each dimension 0 (not related), 1 (slightly related), or 2 (highly related):
+              valuation, future, technical, financials, dividend, management, ownership, sustainability.
+
+            Ensure to return ALL fields in the following JSON format.
+            {format_instructions}
+        """
+
+    @staticmethod
+    def get_batch_prompt():
+        return """You are an expert at classified news articles in batch.
+            Your task is to classified EVERY article in 'Article Batch' following the 'Category Instructions'.
+
+            Category Instructions:
+            {category_instructions}
+
+            Article Batch (JSON list, each item has an "id", "title", and "body"):
+            {articles}
+
+            Batch Rules:
+            - Apply the 'Category Instructions' to each article independently.
+            - Return EXACTLY one result item per article in the batch.
+            - Each result item MUST carry the "id" of the article it belongs to.
+
+            Ensure to return the batch results as a following JSON format.
+            {format_instructions}
+        """
+
     @staticmethod
     def get_summarize_prompt():
         return """You are an expert financial analyst for summarizing Indonesia Stock Market (IDX) article. 
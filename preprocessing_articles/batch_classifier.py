@@ -0,0 +1,200 @@
+"""
+Script to classify news articles in bulk through Groq's batch file API.
+
+Overnight scrapes do not need real-time responses, and batch jobs are billed
+at a discount and completed best-effort within 24h. Real-time callers keep
+using NewsClassifier.classify_article_async.
+"""
+
+from langchain_core.output_parsers import JsonOutputParser
+from groq import Groq
+
+from config.setup import LOGGER, GROQ_API_KEY1
+
+from .extract_classifier import CLASSIFIER, _PYDANTIC_MODELS
+
+import json
+import time
+from typing import List, Optional, Tuple
+
+# Batch job states that will never make further progress
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Categories in the order classify_article_async returns them
+_CATEGORIES = ("tags", "tickers", "subsectors", "sentiment", "dimension")
+
+
+class BatchClassifier:
+    """
+    Submit one Groq batch job covering every (article, category) pair and
+    collect the results once the job completes.
+    """
+
+    def __init__(self, model: str = "llama-3.3-70b-versatile", poll_interval: int = 60):
+        """
+        Initialize the batch classifier.
+
+        Args:
+            model (str): Groq model the batch job runs against
+            poll_interval (int): Seconds between batch status polls
+        """
+        self.client = Groq(api_key=GROQ_API_KEY1)
+        self.model = model
+        self.poll_interval = poll_interval
+
+        # Reuse the singleton classifier's cached prompts and validation
+        self.classifier = CLASSIFIER
+
+        # One parser per category, same schemas as the real-time path
+        self._parsers = {
+            category: JsonOutputParser(pydantic_object=model_class)
+            for category, model_class in _PYDANTIC_MODELS.items()
+        }
+
+    def _render_request(self, article_id: int, category: str, title: str, body: str) -> dict:
+        """
+        Render one JSONL batch request line for an (article, category) pair.
+
+        Args:
+            article_id (int): Index of the article in the submitted list
+            category (str): Classification category
+            title (str): Article title
+            body (str): Article content
+
+        Returns:
+            dict: A single /v1/chat/completions batch request
+        """
+        prompt = self.classifier._build_category_prompt(category)
+
+        if category == "dimension":
+            prompt_text = prompt.format(title=title, body=body)
+        else:
+            prompt_text = prompt.format(body=body)
+
+        return {
+            "custom_id": f"{article_id}-{category}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.model,
+                "temperature": 0.2,
+                # The prompts carry compact key-only format instructions,
+                # which are only safe with JSON mode enforced
+                "response_format": {"type": "json_object"},
+                "messages": [{"role": "user", "content": prompt_text}],
+            },
+        }
+
+    def submit(
+        self, articles: List[Tuple[str, str]], path: str = "./data/batch_requests.jsonl"
+    ) -> str:
+        """
+        Write the JSONL request file, upload it, and create the batch job.
+
+        Args:
+            articles (List[Tuple[str, str]]): List of (title, body) tuples
+            path (str): Where the JSONL request file is written
+
+        Returns:
+            str: The created batch job id
+        """
+        with open(path, "w") as f:
+            for article_id, (title, body) in enumerate(articles):
+                for category in _CATEGORIES:
+                    request = self._render_request(article_id, category, title, body)
+                    f.write(json.dumps(request) + "\n")
+
+        with open(path, "rb") as f:
+            uploaded = self.client.files.create(file=f, purpose="batch")
+
+        batch = self.client.batches.create(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=uploaded.id,
+        )
+
+        LOGGER.info(f"Submitted batch job {batch.id} covering {len(articles)} articles.")
+        return batch.id
+
+    def wait(self, batch_id: str):
+        """
+        Poll the batch job until it reaches a terminal status.
+
+        Args:
+            batch_id (str): Batch job id returned by submit
+
+        Returns:
+            The final batch object from the Groq API
+        """
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+
+            if batch.status in _TERMINAL_STATUSES:
+                LOGGER.info(f"Batch job {batch_id} finished with status: {batch.status}")
+                return batch
+
+            LOGGER.info(f"Batch job {batch_id} status: {batch.status}. Polling again in {self.poll_interval}s.")
+            time.sleep(self.poll_interval)
+
+    def collect(self, batch, article_count: int) -> List[Optional[Tuple]]:
+        """
+        Download the batch output file and assemble per-article results.
+
+        Args:
+            batch: Completed batch object from the Groq API
+            article_count (int): Number of articles submitted
+
+        Returns:
+            List[Optional[Tuple]]: One (tags, tickers, subsector, sentiment,
+                dimension) tuple per article, or None where any category failed.
+        """
+        if batch.status != "completed" or not batch.output_file_id:
+            LOGGER.error(f"Batch job {batch.id} did not complete, no results to collect.")
+            return [None] * article_count
+
+        outputs = {category: [None] * article_count for category in _CATEGORIES}
+
+        content = self.client.files.content(batch.output_file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+
+            try:
+                row = json.loads(line)
+                article_id, category = row["custom_id"].rsplit("-", 1)
+                message = row["response"]["body"]["choices"][0]["message"]["content"]
+
+                parsed = self._parsers[category].parse(message)
+                outputs[category][int(article_id)] = self.classifier._extract_category_output(
+                    category, parsed
+                )
+
+            except Exception as error:
+                LOGGER.error(f"[ERROR] Failed to parse batch result line: {error}")
+                continue
+
+        results = []
+        for index in range(article_count):
+            row = tuple(outputs[category][index] for category in _CATEGORIES)
+            if any(value is None for value in row):
+                LOGGER.error(f"Batch classification incomplete for article {index}.")
+                results.append(None)
+            else:
+                results.append(row)
+
+        return results
+
+    def classify_articles(self, articles: List[Tuple[str, str]]) -> List[Optional[Tuple]]:
+        """
+        End-to-end batch classification: submit, wait, and collect.
+
+        Args:
+            articles (List[Tuple[str, str]]): List of (title, body) tuples
+
+        Returns:
+            List[Optional[Tuple]]: One classification tuple per article,
+                or None where classification failed.
+        """
+        batch_id = self.submit(articles)
+        batch = self.wait(batch_id)
+        return self.collect(batch, len(articles))
@@ -8,22 +8,72 @@ from langchain_core.runnables       import RunnableParallel
 from operator                       import itemgetter
 from supabase                       import create_client, Client
 
-from llm_models.get_models  import LLMCollection, invoke_llm_async
-from llm_models.llm_prompts import (ClassifierPrompts, 
-                                    TagsClassification, 
-                                    TickersClassification, 
-                                    SubsectorClassification, 
-                                    SentimentClassification, 
-                                    DimensionClassification)
+from llm_models.get_models  import LLMCollection, LLMHealthTracker, invoke_llm_async, RateLimiter
+from llm_models.llm_prompts import (ClassifierPrompts,
+                                    TagsClassification,
+                                    TickersClassification,
+                                    SubsectorClassification,
+                                    SentimentClassification,
+                                    DimensionClassification,
+                                    CombinedArticleAnalysis,
+                                    TagsBatchClassification,
+                                    TickersBatchClassification,
+                                    SubsectorBatchClassification,
+                                    SentimentBatchClassification,
+                                    DimensionBatchClassification)
 
 from config.setup           import LOGGER, SUPABASE_URL, SUPABASE_KEY
 
+from .extract_score_news    import _DEFAULT_CRITERIA, _SCORER
+
 import json
+import orjson
 import asyncio
-from datetime import datetime
+import threading
+from datetime import datetime, date
 from typing import List, Dict, Optional, Union, Tuple
 from groq import RateLimitError
-import re 
+import re
+
+# Collapses "&", "," and whitespace runs into a single "-" for sub_sector slugs
+_SLUG_RE = re.compile(r"\s*[&,]\s*|\s+")
+
+
+def _compact_format_instructions(model) -> str:
+    """
+    Short JSON-mode replacement for JsonOutputParser.get_format_instructions().
+
+    The Groq models run with response_format json_object, so the prompt only
+    needs the expected keys instead of the full serialized JSON schema,
+    saving a few hundred prompt tokens per classification call.
+
+    Args:
+        model: Pydantic model describing the expected response
+
+    Returns:
+        str: One-line instruction listing the expected JSON keys
+    """
+    fields = ", ".join(f'"{name}"' for name in model.model_fields)
+    return f"Return a JSON object with exactly these keys: {fields}."
+
+
+# Pydantic model backing the parser of each classification category
+_PYDANTIC_MODELS = {
+    "tags": TagsClassification,
+    "tickers": TickersClassification,
+    "subsectors": SubsectorClassification,
+    "sentiment": SentimentClassification,
+    "dimension": DimensionClassification,
+}
+
+# Pydantic model backing the parser of each batched classification category
+_BATCH_PYDANTIC_MODELS = {
+    "tags": TagsBatchClassification,
+    "tickers": TickersBatchClassification,
+    "subsectors": SubsectorBatchClassification,
+    "sentiment": SentimentBatchClassification,
+    "dimension": DimensionBatchClassification,
+}
 
 class NewsClassifier:
     """
@@ -38,12 +88,67 @@ class NewsClassifier:
         # LLM setup
         self.llm_collection = LLMCollection()
 
+        # Bound concurrent LLM calls to stay within Groq RPM limits
+        self._classify_semaphore = asyncio.Semaphore(3)
+
+        # Per-instance token-bucket limiter, replaces the old blanket sleep.
+        # Keyed by id(llm) since each API key has its own RPM budget
+        self._rate_limiter = RateLimiter()
+
+        # LLM instances (by id) that exhausted their daily token quota,
+        # skipped for the rest of the run. Quotas are per API key, so a
+        # sibling instance of the same model under another key stays usable
+        self._disabled_llms: set = set()
+
+        # Prefers the last healthy LLM and cools down recently failed ones
+        self._health = LLMHealthTracker()
+
         # Cache for loaded data
         self._subsectors_cache: Optional[Dict[str, str]] = None
         self._tags_cache: Optional[List[str]] = None
+        self._tags_set: Optional[frozenset] = None
         self._company_cache: Optional[Dict[str, Dict[str, str]]] = None
         self._prompts_cache: Optional[Dict] = None
 
+        # Dates the Supabase-backed caches were last loaded, so a process that
+        # runs across midnight into the 1st/15th still refreshes exactly once
+        self._subsectors_loaded_date: Optional[date] = None
+        self._companies_loaded_date: Optional[date] = None
+
+        # Single-flight guard for the loaders (they run from worker threads too)
+        self._data_lock = threading.Lock()
+
+        # Comma-joined reference strings for the prompts, serialized once on load
+        self._tags_joined: Optional[str] = None
+        self._tickers_joined: Optional[str] = None
+        self._subsectors_joined: Optional[str] = None
+
+        # Cache for built prompt templates and composed chains
+        self._prompt_cache: Dict[str, PromptTemplate] = {}
+        self._chain_cache: Dict[Tuple[str, int], object] = {}
+
+        # Parsers and their format instructions, computed once per category
+        self._parsers: Dict[str, JsonOutputParser] = {
+            category: JsonOutputParser(pydantic_object=model)
+            for category, model in _PYDANTIC_MODELS.items()
+        }
+        self._batch_parsers: Dict[str, JsonOutputParser] = {
+            category: JsonOutputParser(pydantic_object=model)
+            for category, model in _BATCH_PYDANTIC_MODELS.items()
+        }
+        self._format_instructions: Dict[str, str] = {
+            category: _compact_format_instructions(model)
+            for category, model in _PYDANTIC_MODELS.items()
+        }
+        self._batch_format_instructions: Dict[str, str] = {
+            category: parser.get_format_instructions()
+            for category, parser in self._batch_parsers.items()
+        }
+
+        # Parser for the fused score + classification call
+        self._combined_parser = JsonOutputParser(pydantic_object=CombinedArticleAnalysis)
+        self._combined_format_instructions = self._combined_parser.get_format_instructions()
+
         # Classifier prompts
         self.prompts = ClassifierPrompts()
 
@@ -54,26 +159,36 @@ class NewsClassifier:
         Returns:
             Dict[str, str]: Dictionary mapping subsector slugs to descriptions
         """
-        if self._subsectors_cache is not None:
-            return self._subsectors_cache
+        with self._data_lock:
+            today = datetime.today().date()
+            refresh_due = today.day in [1, 15] and self._subsectors_loaded_date != today
+
+            if self._subsectors_cache is not None and not refresh_due:
+                return self._subsectors_cache
+
+            if refresh_due:
+                response = (
+                    self.supabase.table("idx_subsector_metadata")
+                    .select("slug, description")
+                    .execute()
+                )
 
-        if datetime.today().day in [1, 15]:
-            response = (
-                self.supabase.table("idx_subsector_metadata")
-                .select("slug, description")
-                .execute()
-            )
+                subsectors = {row["slug"]: row["description"] for row in response.data}
 
-            subsectors = {row["slug"]: row["description"] for row in response.data}
+                with open("./data/subsectors_data.json", "wb") as f:
+                    f.write(orjson.dumps(subsectors))
 
-            with open("./data/subsectors_data.json", "w") as f:
-                json.dump(subsectors, f)
-        else:
-            with open("./data/subsectors_data.json", "r") as f:
-                subsectors = json.load(f)
+                # The cached prompts baked in the old subsector list
+                self._prompt_cache.clear()
+                self._chain_cache.clear()
+            else:
+                with open("./data/subsectors_data.json", "rb") as f:
+                    subsectors = orjson.loads(f.read())
 
-        self._subsectors_cache = subsectors
-        return subsectors
+            self._subsectors_cache = subsectors
+            self._subsectors_loaded_date = today
+            self._subsectors_joined = ", ".join(subsectors.keys())
+            return subsectors
 
     def _load_tag_data(self) -> List[str]:
         """
@@ -85,10 +200,12 @@ class NewsClassifier:
         if self._tags_cache is not None:
             return self._tags_cache
 
-        with open("./data/unique_tags.json", "r") as f:
-            tags = json.load(f)
+        with open("./data/unique_tags.json", "rb") as f:
+            tags = orjson.loads(f.read())
 
         self._tags_cache = tags
+        self._tags_set = frozenset(tags)
+        self._tags_joined = ", ".join(tags)
         return tags
 
     def _load_company_data(self) -> Dict[str, Dict[str, str]]:
@@ -98,68 +215,72 @@ class NewsClassifier:
         Returns:
             Dict[str, Dict[str, str]]: Dictionary mapping company symbols to their details
         """
-        if self._company_cache is not None:
-            return self._company_cache
-
-        if datetime.today().day in [1, 15]:
-            response = (
-                self.supabase.table("idx_company_profile")
-                .select("symbol, company_name, sub_sector_id")
-                .execute()
-            )
-
-            subsector_response = (
-                self.supabase.table("idx_subsector_metadata")
-                .select("sub_sector_id, sub_sector")
-                .execute()
-            )
-
-            subsector_data = {
-                row["sub_sector_id"]: row["sub_sector"]
-                for row in subsector_response.data
-            }
-
-            company = {}
-            for row in response.data:
-                company[row["symbol"]] = {
-                    "symbol": row["symbol"],
-                    "name": row["company_name"],
-                    "sub_sector": subsector_data[row["sub_sector_id"]],
-                }
-
-            for attr in company:
-                company[attr]["sub_sector"] = (
-                    company[attr]["sub_sector"]
-                    .replace("&", "")
-                    .replace(",", "")
-                    .replace("  ", " ")
-                    .replace(" ", "-")
-                    .lower()
+        with self._data_lock:
+            today = datetime.today().date()
+            refresh_due = today.day in [1, 15] and self._companies_loaded_date != today
+
+            if self._company_cache is not None and not refresh_due:
+                return self._company_cache
+
+            if refresh_due:
+                response = (
+                    self.supabase.table("idx_company_profile")
+                    .select("symbol, company_name, sub_sector_id")
+                    .execute()
                 )
 
-            with open("./data/companies.json", "w") as f:
-                json.dump(company, f, indent=2)
-        else:
-            with open("./data/companies.json", "r") as f:
-                company = json.load(f)
+                subsector_response = (
+                    self.supabase.table("idx_subsector_metadata")
+                    .select("sub_sector_id, sub_sector")
+                    .execute()
+                )
 
-        self._company_cache = company
-        return company
+                subsector_data = {
+                    row["sub_sector_id"]: row["sub_sector"]
+                    for row in subsector_response.data
+                }
 
-    async def _classify_openai_async(
-        self, body: str, category: str, title: str = ""
-    ) -> Union[List[str], str]:
+                company = {}
+                for row in response.data:
+                    company[row["symbol"]] = {
+                        "symbol": row["symbol"],
+                        "name": row["company_name"],
+                        "sub_sector": subsector_data[row["sub_sector_id"]],
+                    }
+
+                for attr in company:
+                    company[attr]["sub_sector"] = (
+                        _SLUG_RE.sub("-", company[attr]["sub_sector"]).strip("-").lower()
+                    )
+
+                with open("./data/companies.json", "wb") as f:
+                    f.write(orjson.dumps(company, option=orjson.OPT_INDENT_2))
+
+                # The cached prompts baked in the old ticker list
+                self._prompt_cache.clear()
+                self._chain_cache.clear()
+            else:
+                with open("./data/companies.json", "rb") as f:
+                    company = orjson.loads(f.read())
+
+            self._company_cache = company
+            self._companies_loaded_date = today
+            self._tickers_joined = ", ".join(company.keys())
+            return company
+
+    def _build_category_prompt(self, category: str) -> PromptTemplate:
         """
-        Asynchronously classify text using LLM based on the specified category.
+        Build (once) the fully partialed prompt template for a category.
 
         Args:
-            body (str): Text to classify
-            category (str): Category to classify into (tags, tickers, subsectors, sentiment, dimension)
-            title (str): Article title (required for dimension category)
+            category (str): Category to build the prompt for
 
         Returns:
-            Union[List[str], str]: Classification results
+            PromptTemplate: Prompt with format instructions and category data baked in
         """
+        if category in self._prompt_cache:
+            return self._prompt_cache[category]
+
         # Prompt template mapping
         prompt_methods = {
             "tags": self.prompts.get_tags_prompt(),
@@ -169,27 +290,6 @@ class NewsClassifier:
             "dimension": self.prompts.get_dimension_prompt()
         }
 
-        # Load tag data
-        tags = self._load_tag_data()
-
-        # Load company data 
-        company = self._load_company_data()
-        
-        # Load subsector data
-        subsectors = self._load_subsector_data()
-
-        # Pydantic mapping 
-        model_mapping = {
-            "tags": TagsClassification,
-            "tickers": TickersClassification,
-            "subsectors": SubsectorClassification,
-            "sentiment": SentimentClassification,
-            "dimension": DimensionClassification
-        }
-
-        # Create Parser
-        classifier_parser = JsonOutputParser(pydantic_object=model_mapping.get(category))
-        
         # Get prompt template
         template = prompt_methods.get(category)
 
@@ -199,22 +299,45 @@ class NewsClassifier:
         else:
             input_variables = ['body']
 
-        # Create prompt with input variables and format instructions
+        # Create prompt with input variables and precomputed format instructions
         prompt = PromptTemplate(
-            template=template, 
+            template=template,
             input_variables=input_variables,
             partial_variables={
-                "format_instructions": classifier_parser.get_format_instructions()
+                "format_instructions": self._format_instructions.get(category)
             }
         )
 
-        # Add category-specific data to prompt
+        # Add category-specific data to prompt, joined once by the loaders
         if category == "tags":
-            prompt = prompt.partial(tags=", ".join(tags))
+            self._load_tag_data()
+            prompt = prompt.partial(tags=self._tags_joined)
         elif category == "tickers":
-            prompt = prompt.partial(tickers=", ".join(company.keys()))
+            self._load_company_data()
+            prompt = prompt.partial(tickers=self._tickers_joined)
         elif category == "subsectors":
-            prompt = prompt.partial(subsectors=", ".join(subsectors.keys()))
+            self._load_subsector_data()
+            prompt = prompt.partial(subsectors=self._subsectors_joined)
+
+        self._prompt_cache[category] = prompt
+        return prompt
+
+    def _get_classifier_chain(self, category: str, llm) -> object:
+        """
+        Get (or build and cache) the composed chain for a (category, llm) pair.
+
+        Args:
+            category (str): Classification category
+            llm: LLM instance from the collection
+
+        Returns:
+            The composed runnable chain for this category and LLM
+        """
+        # Key by instance: the collection holds the same model under several
+        # API keys, and each instance must keep its own chain
+        key = (category, id(llm))
+        if key in self._chain_cache:
+            return self._chain_cache[key]
 
         # Create runnable system based on category
         if category == "dimension":
@@ -226,74 +349,501 @@ class NewsClassifier:
             runnable_system = RunnableParallel({
                 "body": itemgetter("body")
             })
-        
-        # Prepare input data
+
+        chain = (
+            runnable_system
+            | self._build_category_prompt(category)
+            | llm
+            | self._parsers.get(category)
+        )
+
+        self._chain_cache[key] = chain
+        return chain
+
+    def _build_batch_prompt(self, category: str) -> PromptTemplate:
+        """
+        Build (once) the batch prompt template for a category.
+
+        Args:
+            category (str): Category to build the batch prompt for
+
+        Returns:
+            PromptTemplate: Batch prompt with instructions and format baked in
+        """
+        cache_key = f"batch:{category}"
+        if cache_key in self._prompt_cache:
+            return self._prompt_cache[cache_key]
+
+        # Make sure the joined reference strings are populated
+        self._load_tag_data()
+        self._load_company_data()
+        self._load_subsector_data()
+
+        # Condensed per-category instructions applied to every article in a batch
+        category_instructions = {
+            "tags": (
+                "Identify AT MOST 5 relevant tags for each article, ONLY from this list of "
+                "available tags: " + self._tags_joined + ". "
+                "Do not create, modify, or infer new tags."
+            ),
+            "tickers": (
+                "Identify the stock tickers explicitly mentioned in each article, matched "
+                "against this list of available tickers: " + self._tickers_joined + ". "
+                "Do not modify, infer, or abbreviate ticker symbols."
+            ),
+            "subsectors": (
+                "Identify the ONE most relevant subsector for each article from this list of "
+                "available subsectors: " + self._subsectors_joined + ". "
+                "Return an empty string when no subsector applies."
+            ),
+            "sentiment": (
+                "Classify the sentiment of each article as Bullish, Bearish, or Neutral "
+                "from the perspective of Indonesia's stock investors."
+            ),
+            "dimension": (
+                "Score each article 0 (not related), 1 (slightly related), or 2 (highly related) "
+                "for every dimension: valuation, future, technical, financials, dividend, "
+                "management, ownership, sustainability."
+            ),
+        }
+
+        prompt = PromptTemplate(
+            template=self.prompts.get_batch_prompt(),
+            input_variables=["articles"],
+            partial_variables={
+                "category_instructions": category_instructions.get(category),
+                "format_instructions": self._batch_format_instructions.get(category)
+            }
+        )
+
+        self._prompt_cache[cache_key] = prompt
+        return prompt
+
+    def _get_batch_chain(self, category: str, llm) -> object:
+        """
+        Get (or build and cache) the batch chain for a (category, llm) pair.
+
+        Args:
+            category (str): Classification category
+            llm: LLM instance from the collection
+
+        Returns:
+            The composed batch chain for this category and LLM
+        """
+        key = (f"batch:{category}", id(llm))
+        if key in self._chain_cache:
+            return self._chain_cache[key]
+
+        runnable_system = RunnableParallel({
+            "articles": itemgetter("articles")
+        })
+
+        chain = (
+            runnable_system
+            | self._build_batch_prompt(category)
+            | llm
+            | self._batch_parsers.get(category)
+        )
+
+        self._chain_cache[key] = chain
+        return chain
+
+    def _build_combined_prompt(self) -> PromptTemplate:
+        """
+        Build (once) the fused score + classification prompt template.
+
+        Returns:
+            PromptTemplate: Combined prompt with criteria, reference data and
+                format instructions baked in
+        """
+        if "combined" in self._prompt_cache:
+            return self._prompt_cache["combined"]
+
+        # Make sure the joined reference strings are populated
+        self._load_tag_data()
+        self._load_company_data()
+        self._load_subsector_data()
+
+        prompt = PromptTemplate(
+            template=self.prompts.get_combined_prompt(),
+            input_variables=["title", "body"],
+            partial_variables={
+                "criteria": _DEFAULT_CRITERIA,
+                "tags": self._tags_joined,
+                "tickers": self._tickers_joined,
+                "subsectors": self._subsectors_joined,
+                "format_instructions": self._combined_format_instructions
+            }
+        )
+
+        self._prompt_cache["combined"] = prompt
+        return prompt
+
+    def _get_combined_chain(self, llm) -> object:
+        """
+        Get (or build and cache) the fused analysis chain for an LLM.
+
+        Args:
+            llm: LLM instance from the collection
+
+        Returns:
+            The composed combined chain for this LLM
+        """
+        key = ("combined", id(llm))
+        if key in self._chain_cache:
+            return self._chain_cache[key]
+
+        runnable_system = RunnableParallel({
+            "title": itemgetter("title"),
+            "body": itemgetter("body")
+        })
+
+        chain = (
+            runnable_system
+            | self._build_combined_prompt()
+            | llm
+            | self._combined_parser
+        )
+
+        self._chain_cache[key] = chain
+        return chain
+
+    async def analyze_article_async(
+        self, title: str, body: str, article_date: str, article_source: str
+    ) -> Optional[Dict]:
+        """
+        Score and classify an article with a single fused LLM call.
+
+        Collapses the separate scoring call and five classification calls
+        into one round-trip per article. The manual timeliness and source
+        credibility scores are still added on top of the LLM score.
+
+        Args:
+            title (str): Article title
+            body (str): Article content
+            article_date (str): Publication date of the article
+            article_source (str): Source URL of the article
+
+        Returns:
+            Optional[Dict]: Dict with keys score, tags, tickers, subsector,
+                sentiment and dimension, or None when every LLM failed.
+        """
         input_data = {"title": title, "body": body}
 
-        for llm in self.llm_collection.get_llms():
+        for llm in self._health.order(self.llm_collection.get_llms()):
+            # Skip LLMs that already hit their daily token quota
+            if id(llm) in self._disabled_llms:
+                continue
+
             try:
-                # Create chain with current LLM
-                classifier_chain = (
-                    runnable_system
-                    | prompt 
-                    | llm 
-                    | classifier_parser
+                combined_chain = self._get_combined_chain(llm)
+
+                async with self._classify_semaphore:
+                    await self._rate_limiter.wait(id(llm))
+                    result = await invoke_llm_async(combined_chain, input_data)
+
+                if result is None:
+                    self._health.record_failure(llm)
+                    LOGGER.warning("API call failed for combined analysis. trying next LLM.")
+                    continue
+
+                # Final score adding with manual score time and source
+                final_score = (
+                    result.get("score", 0)
+                    + _SCORER.manual_score_time(article_date)
+                    + _SCORER.manual_score_source(article_source)
                 )
+                final_score = max(0, min(155, final_score))
+
+                self._health.record_success(llm)
+
+                dimension = {
+                    key: result.get(key, None)
+                    for key in (
+                        "valuation", "future", "technical", "financials",
+                        "dividend", "management", "ownership", "sustainability",
+                    )
+                }
 
-                # Process with current LLM
-                result = await invoke_llm_async(classifier_chain, input_data)
-    
-                # Sleep 8s
-                await asyncio.sleep(8)
+                return {
+                    "score": final_score,
+                    "tags": self._extract_category_output("tags", result),
+                    "tickers": result.get("tickers", []),
+                    "subsector": result.get("subsector", ""),
+                    "sentiment": result.get("sentiment", ""),
+                    "dimension": dimension,
+                }
+
+            except RateLimitError as error:
+                error_message = str(error).lower()
+                if "tokens per day" in error_message or "tpd" in error_message:
+                    LOGGER.warning(f"LLM: {llm.model_name} hit its daily token limit. Disabling it for this run.")
+                    self._disabled_llms.add(id(llm))
+                    continue
+
+            except json.JSONDecodeError as error:
+                self._health.record_failure(llm)
+                LOGGER.error(f"[ERROR] LLM Failed combined analysis returned malformed JSON: {error}")
+                continue
+
+            except Exception as error:
+                self._health.record_failure(llm)
+                LOGGER.error(f"[ERROR] LLM failed combined analysis with error: {error}")
+                continue
+
+        LOGGER.error("All LLMs failed for combined article analysis.")
+        return None
+
+    async def _classify_batch_async(
+        self, batch: List[Tuple[str, str]], category: str
+    ) -> Optional[List]:
+        """
+        Classify one micro-batch of articles for a single category.
+
+        Args:
+            batch (List[Tuple[str, str]]): List of (title, body) tuples
+            category (str): Classification category
+
+        Returns:
+            Optional[List]: Per-article results in batch order, or None when
+                every LLM failed for this batch.
+        """
+        # Marshal the batch into one numbered JSON payload
+        payload = json.dumps(
+            [
+                {"id": index, "title": title, "body": body}
+                for index, (title, body) in enumerate(batch)
+            ]
+        )
+        input_data = {"articles": payload}
+
+        for llm in self._health.order(self.llm_collection.get_llms()):
+            # Skip LLMs that already hit their daily token quota
+            if id(llm) in self._disabled_llms:
+                continue
+
+            try:
+                batch_chain = self._get_batch_chain(category, llm)
+
+                async with self._classify_semaphore:
+                    await self._rate_limiter.wait(id(llm))
+                    result = await invoke_llm_async(batch_chain, input_data)
+
+                if result is None:
+                    self._health.record_failure(llm)
+                    LOGGER.warning(f"API call failed for batch category: {category}. trying next LLM.")
+                    continue
+
+                # Scatter results back to input order by id
+                items = {item.get("id"): item for item in result.get("results", [])}
+                if any(index not in items for index in range(len(batch))):
+                    LOGGER.warning(
+                        f"Batch {category} returned incomplete results for {len(batch)} articles. trying next LLM."
+                    )
+                    continue
+
+                self._health.record_success(llm)
+
+                # Drop the batch-internal id so dimension payloads keep the
+                # same shape as the per-article path
+                for item in items.values():
+                    item.pop("id", None)
+
+                return [
+                    self._extract_category_output(category, items[index])
+                    for index in range(len(batch))
+                ]
+
+            except RateLimitError as error:
+                error_message = str(error).lower()
+                if "tokens per day" in error_message or "tpd" in error_message:
+                    LOGGER.warning(f"LLM: {llm.model_name} hit its daily token limit. Disabling it for this run.")
+                    self._disabled_llms.add(id(llm))
+                    continue
+
+            except json.JSONDecodeError as error:
+                self._health.record_failure(llm)
+                LOGGER.error(f"[ERROR] LLM Failed batch classified returned malformed JSON: {error}")
+                continue
+
+            except Exception as error:
+                self._health.record_failure(llm)
+                LOGGER.error(f"[ERROR] LLM failed batch classified with error: {error}")
+                continue
+
+        LOGGER.error(f"All LLMs failed for batch category '{category}'.")
+        return None
+
+    async def classify_articles_batch_async(
+        self, articles: List[Tuple[str, str]], k: int = 8
+    ) -> List[Optional[Tuple]]:
+        """
+        Classify many articles by marshaling them into micro-batched LLM calls.
+
+        Instead of five LLM round-trips per article, every micro-batch of up to
+        k articles shares a single call per category. Micro-batches that fail
+        to produce a usable result fall back to per-article classification.
+
+        Args:
+            articles (List[Tuple[str, str]]): List of (title, body) tuples
+            k (int): Max articles marshaled into a single LLM call
+
+        Returns:
+            List[Optional[Tuple]]: One (tags, tickers, subsector, sentiment,
+                dimension) tuple per article, or None where classification failed.
+        """
+        categories = ("tags", "tickers", "subsectors", "sentiment", "dimension")
+        batches = [(start, articles[start:start + k]) for start in range(0, len(articles), k)]
+
+        # One concurrent call per (micro-batch, category)
+        coros = [
+            self._classify_batch_async(batch, category)
+            for _, batch in batches
+            for category in categories
+        ]
+        batch_results = await asyncio.gather(*coros, return_exceptions=True)
+
+        # Scatter batch results back to per-article slots
+        outputs = {category: [None] * len(articles) for category in categories}
+        fallback_indices = set()
+        position = 0
+        for start, batch in batches:
+            for category in categories:
+                result = batch_results[position]
+                position += 1
+
+                if isinstance(result, Exception) or result is None:
+                    fallback_indices.update(range(start, start + len(batch)))
+                    continue
+
+                for offset, value in enumerate(result):
+                    outputs[category][start + offset] = value
+
+        # Per-article fallback for articles whose micro-batch failed
+        fallback_map = {}
+        if fallback_indices:
+            LOGGER.warning(f"Falling back to per-article classification for {len(fallback_indices)} articles.")
+            ordered_fallback = sorted(fallback_indices)
+            fallback_results = await asyncio.gather(
+                *[
+                    self.classify_article_async(articles[index][0], articles[index][1])
+                    for index in ordered_fallback
+                ]
+            )
+            fallback_map = dict(zip(ordered_fallback, fallback_results))
+
+        final_results = []
+        for index in range(len(articles)):
+            if index in fallback_indices:
+                final_results.append(fallback_map[index])
+            else:
+                final_results.append(
+                    tuple(outputs[category][index] for category in categories)
+                )
+
+        return final_results
+
+    def _extract_category_output(
+        self, category: str, result: Dict
+    ) -> Union[List[str], str, Dict]:
+        """
+        Pull the category payload out of a parsed LLM result and validate it.
+
+        Args:
+            category (str): Classification category
+            result (Dict): Parsed JSON result from the LLM
+
+        Returns:
+            Union[List[str], str, Dict]: Validated classification output
+        """
+        if category == "tags":
+            self._load_tag_data()
+            seen = set()
+            check_tags = []
+            for tag in result.get("tags", []):
+                if tag in self._tags_set and tag not in seen:
+                    seen.add(tag)
+                    check_tags.append(tag)
+            return check_tags
+        elif category == "tickers":
+            return result.get("tickers", [])
+        elif category == "subsectors":
+            return result.get("subsector", "")
+        elif category == "sentiment":
+            return result.get("sentiment", "")
+        elif category == "dimension":
+            # For dimension, return the entire dict or extract specific fields
+            if isinstance(result, dict):
+                return result
+            else:
+                # Fallback if result is not a dict
+                return {
+                    "valuation": result.get("valuation", None),
+                    "future": result.get("future", None),
+                    "technical": result.get("technical", None),
+                    "financials": result.get("financials", None),
+                    "dividend": result.get("dividend", None),
+                    "management": result.get("management", None),
+                    "ownership": result.get("ownership", None),
+                    "sustainability": result.get("sustainability", None),
+                }
+
+    async def _classify_openai_async(
+        self, body: str, category: str, title: str = ""
+    ) -> Union[List[str], str]:
+        """
+        Asynchronously classify text using LLM based on the specified category.
+
+        Args:
+            body (str): Text to classify
+            category (str): Category to classify into (tags, tickers, subsectors, sentiment, dimension)
+            title (str): Article title (required for dimension category)
+
+        Returns:
+            Union[List[str], str]: Classification results
+        """
+        # Prepare input data
+        input_data = {"title": title, "body": body}
+
+        for llm in self._health.order(self.llm_collection.get_llms()):
+            # Skip LLMs that already hit their daily token quota
+            if id(llm) in self._disabled_llms:
+                continue
+
+            try:
+                # Reuse the cached chain for this category and LLM
+                classifier_chain = self._get_classifier_chain(category, llm)
+
+                # Process with current LLM, bounded by the semaphore and rate limiter
+                async with self._classify_semaphore:
+                    await self._rate_limiter.wait(id(llm))
+                    result = await invoke_llm_async(classifier_chain, input_data)
 
                 if result is None : 
+                    self._health.record_failure(llm)
                     LOGGER.warning(f"API call failed for category: {category}. trying next LLM.")
                     continue 
 
+                self._health.record_success(llm)
+
                 # Return based on category type
-                if category == "tags":
-                    result_output = result.get("tags", [])
-                    seen = set()
-                    check_tags = []
-                    for tag in result_output: 
-                        if tag in tags and tag not in seen:
-                            seen.add(tag)
-                            check_tags.append(tag) 
-                    return check_tags
-                elif category == "tickers":
-                    return result.get("tickers", [])
-                elif category == "subsectors":
-                    return result.get("subsector", "")
-                elif category == "sentiment":
-                    return result.get("sentiment", "")
-                elif category == "dimension":
-                    # For dimension, return the entire dict or extract specific fields
-                    if isinstance(result, dict):
-                        return result
-                    else:
-                        # Fallback if result is not a dict
-                        return {
-                            "valuation": result.get("valuation", None),
-                            "future": result.get("future", None),
-                            "technical": result.get("technical", None),
-                            "financials": result.get("financials", None),
-                            "dividend": result.get("dividend", None),
-                            "management": result.get("management", None),
-                            "ownership": result.get("ownership", None),
-                            "sustainability": result.get("sustainability", None),
-                        }
-            
+                return self._extract_category_output(category, result)
+
+
             except RateLimitError as error:
                 error_message = str(error).lower()
                 if "tokens per day" in error_message or "tpd" in error_message:
-                    LOGGER.warning(f"LLM: {llm.model_name} hit its daily token limit. Moving to next LLM.")
-                    continue 
+                    LOGGER.warning(f"LLM: {llm.model_name} hit its daily token limit. Disabling it for this run.")
+                    self._disabled_llms.add(id(llm))
+                    continue
 
             except json.JSONDecodeError as error:
+                self._health.record_failure(llm)
                 LOGGER.error(f"[ERROR] LLM Failed classified returned malformed JSON: {error}")
                 continue
 
             except Exception as error:
+                self._health.record_failure(llm)
                 LOGGER.error(f"[ERROR] LLM failed classified with error: {error}")
                 continue
             
@@ -301,12 +851,46 @@ class NewsClassifier:
         LOGGER.error(f"All LLMs failed for category '{category}'.")
         return None
 
+    async def classify_article_stream(self, title: str, body: str):
+        """
+        Stream per-category classification results as soon as each completes.
+
+        Lets downstream code persist or emit the fast categories (sentiment
+        often finishes first) without waiting on the slowest one.
+
+        Args:
+            title (str): Article title
+            body (str): Article content
+
+        Yields:
+            Tuple[str, Union[List[str], str, Dict, None]]: (category, result)
+                pairs in completion order, result is None when a category failed.
+        """
+        tasks = {
+            asyncio.create_task(self._classify_openai_async(body, category, title)): category
+            for category in ("tags", "tickers", "subsectors", "sentiment", "dimension")
+        }
+
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                category = tasks[task]
+                try:
+                    yield category, task.result()
+                except Exception as error:
+                    LOGGER.error(f"Classification stream failed for category '{category}': {error}")
+                    yield category, None
+
     async def classify_article_async(
         self, title: str, body: str
     ) -> Tuple[List[str], List[str], str, str, Dict[str, Optional[int]]]:
         """
         Asynchronously classify an article's tags, tickers, subsector, sentiment, and dimensions.
 
+        Aggregates classify_article_stream, the five category chains still run
+        concurrently under the shared semaphore and rate limiter.
+
         Args:
             title (str): Article title
             body (str): Article content
@@ -315,20 +899,23 @@ class NewsClassifier:
             Tuple[List[str], List[str], str, str, Dict[str, Optional[int]]]:
                 (tags, tickers, subsector, sentiment, dimensions)
         """
-        # Llama groq sensitive to ratelimit, so decied to not use .gather but sequential instead
-        tags = await self._classify_openai_async(body, "tags", title)
-        tickers = await self._classify_openai_async(body, "tickers", title)  
-        subsector = await self._classify_openai_async(body, "subsectors", title)
-        sentiment = await self._classify_openai_async(body, "sentiment", title)
-        dimension = await self._classify_openai_async(body, "dimension", title)
+        results = {}
+        async for category, result in self.classify_article_stream(title, body):
+            results[category] = result
 
-        # Check for ANY failure: either an unexpected Exception OR None signal
-        results = [tags, tickers, subsector, sentiment, dimension]
-        if any(isinstance(res, Exception) or res is None for res in results):
+        # Check for ANY failure: a category that never completed or a None signal
+        if any(results.get(category) is None for category in
+               ("tags", "tickers", "subsectors", "sentiment", "dimension")):
             LOGGER.error("One or more classification steps failed. Failing entire article classification.")
             return None
 
-        return tags, tickers, subsector, sentiment, dimension
+        return (
+            results["tags"],
+            results["tickers"],
+            results["subsectors"],
+            results["sentiment"],
+            results["dimension"],
+        )
 
 
 # Create a singleton instance
@@ -15,16 +15,76 @@ from langchain.prompts              import PromptTemplate
 from langchain_core.output_parsers  import JsonOutputParser
 from groq                           import RateLimitError
 
-from llm_models.get_models  import LLMCollection, invoke_llm
+from llm_models.get_models  import LLMCollection, LLMHealthTracker, invoke_llm, invoke_llm_async
 from llm_models.llm_prompts import ScoringNews, ClassifierPrompts
 from config.setup           import LOGGER
 
 from datetime       import datetime, timedelta
-from typing         import Optional
+from typing         import Dict, List, Optional, Tuple
 from urllib.parse   import urlparse
-import json 
+import asyncio
+import hashlib
+import json
 import time
-import re 
+import re
+
+# Default scoring criteria for news articles, built once at import
+_DEFAULT_CRITERIA = """
+    News Article Scoring Criteria (0-100). But with bonus point can goes up to 135.
+
+    Tier 0: Noise / Irrelevant (Score 0-10)
+    - Description: The news has no discernible connection to the Indonesian market, specific IDX companies, or relevant economic factors.
+      It is generic, trivial, or completely off-topic.
+    - Example: "A foreign celebrity launched a new clothing line. The event was attended by many fans."
+
+    Tier 1: General Context (Score 11-40)
+    - Description: The news provides general background information about the Indonesian economy, a broad market sector, or global trends that have a weak or indirect link to the IDX.
+      It lacks specific company details or actionable events.
+    - Example: "The Indonesian central bank noted that inflation has remained stable for the past quarter. Global commodity prices have seen slight fluctuations this week."
+
+    Tier 2: Notable Event (Score 41-70)
+    - Description: The news reports on a specific IDX-listed company or a direct policy change affecting a specific sector.
+      It describes a concrete event like a new project, a strategic partnership, management changes, or an analyst's rating update.
+      This tier is for news that is clearly relevant and noteworthy for tracking.
+    - Example: "PT Aneka Tambang (ANTM) announced it is exploring a new partnership to develop an EV battery ecosystem. The company's stock rose 2% on the news."
+
+    Tier 3: Critical & Actionable (Score 71-100)
+    - Description: The news reports on a major, market-moving event for a specific IDX-listed company. These are high-impact events that investors often act on immediately.
+    - Keywords to look for:
+        - Merger / Acquisition (M&A)
+        - Earnings Report (especially with results like "beat expectations" or "missed targets")
+        - Dividend Announcement (especially with specific rates or dates)
+        - Stock Buyback / Rights Issue
+        - Major Insider Trading (large buy/sell by executives)
+        - A government contract awarded or a major regulatory approval/rejection.
+    - Example: "PT GoTo Gojek Tokopedia (GOTO) reported a 30% revenue jump in its Q2 2025 earnings, significantly beating forecasts. The company also announced a 1 trillion rupiah stock buyback program to boost shareholder value."
+
+    Bonus Criteria for High-Quality News (Additional Points)
+
+    1. Primary CTA (Up to 5 Points Each):
+        Does the article mention any of the following?
+         - Dividend rate + cum date (+5 points)
+         - Policy/Bill Passing (especially if it's eyeball-catching) (+5 points)
+         - Insider trading (especially if it's eyeball-catching) (+5 points)
+         - Acquisition/Merging (+5 points)
+         - Launching of a new company business plan (new project/income source/new partner/new contract) (+5 points)
+         - Earnings Report (+5 points)
+
+    2. Secondary CTA (Up to 2 Points Each):
+        Does the article mention any of the following?
+         - IDX performance against the US market (+2 points)
+         - Rupiah performance (+2 points)
+         - Net foreign buy and sell (+2 points)
+         - Recommended stocks (stock watchlist) (+2 points)
+         - Global commodities prices (+2 points)
+
+    A high quality news article is one that is:
+        1. actionable
+        2. commercially valuable (request for proposal on a new coal site)
+        3. big movement of money (merger and acquisitions, large insider purchase etc)
+        4. potential big changes for market cap in the industry
+    """
+
 
 class ArticleScorer:
     """
@@ -40,6 +100,55 @@ class ArticleScorer:
         # Classifier prompts
         self.prompts = ClassifierPrompts()
 
+        # Content-keyed score cache, loaded lazily from disk
+        self._score_cache: Optional[Dict[str, int]] = None
+
+        # Prefers the last healthy LLM and cools down recently failed ones
+        self._health = LLMHealthTracker()
+
+        # Scoring parser, prompt and runnable are static, build them once.
+        # The criteria is baked into the prompt so it is not re-sent per call.
+        self._scoring_parser = JsonOutputParser(pydantic_object=ScoringNews)
+        self._scoring_prompt = PromptTemplate(
+            template=self.prompts.get_scoring_prompt(),
+            input_variables=["body"],
+            partial_variables={
+                "criteria": _DEFAULT_CRITERIA,
+                "format_instructions": self._scoring_parser.get_format_instructions()
+            }
+        )
+        self._scoring_runnable = RunnableParallel(
+            {
+                "body": itemgetter("body"),
+            }
+        )
+
+        # Composed scoring chain per LLM instance, built lazily
+        self._scoring_chains: Dict[int, object] = {}
+
+    def _get_scoring_chain(self, llm) -> object:
+        """
+        Get (or build and cache) the scoring chain for an LLM.
+
+        Args:
+            llm: LLM instance from the collection
+
+        Returns:
+            The composed scoring chain for this LLM
+        """
+        # Key by instance: the collection holds the same model under several
+        # API keys, and each instance must keep its own chain
+        chain = self._scoring_chains.get(id(llm))
+        if chain is None:
+            chain = (
+                self._scoring_runnable
+                | self._scoring_prompt
+                | llm
+                | self._scoring_parser
+            )
+            self._scoring_chains[id(llm)] = chain
+        return chain
+
     def _get_default_criteria(self) -> str:
         """
         Get default scoring criteria.
@@ -47,77 +156,62 @@ class ArticleScorer:
         Returns:
             str: Default scoring criteria for news articles.
         """
-        return """
-            News Article Scoring Criteria (0-100). But with bonus point can goes up to 135.
-
-            Tier 0: Noise / Irrelevant (Score 0-10)
-            - Description: The news has no discernible connection to the Indonesian market, specific IDX companies, or relevant economic factors. 
-              It is generic, trivial, or completely off-topic.
-            - Example: "A foreign celebrity launched a new clothing line. The event was attended by many fans."
-
-            Tier 1: General Context (Score 11-40)
-            - Description: The news provides general background information about the Indonesian economy, a broad market sector, or global trends that have a weak or indirect link to the IDX. 
-              It lacks specific company details or actionable events.
-            - Example: "The Indonesian central bank noted that inflation has remained stable for the past quarter. Global commodity prices have seen slight fluctuations this week."
-
-            Tier 2: Notable Event (Score 41-70)
-            - Description: The news reports on a specific IDX-listed company or a direct policy change affecting a specific sector. 
-              It describes a concrete event like a new project, a strategic partnership, management changes, or an analyst's rating update. 
-              This tier is for news that is clearly relevant and noteworthy for tracking.
-            - Example: "PT Aneka Tambang (ANTM) announced it is exploring a new partnership to develop an EV battery ecosystem. The company's stock rose 2% on the news."
-
-            Tier 3: Critical & Actionable (Score 71-100)
-            - Description: The news reports on a major, market-moving event for a specific IDX-listed company. These are high-impact events that investors often act on immediately.
-            - Keywords to look for:
-                - Merger / Acquisition (M&A)
-                - Earnings Report (especially with results like "beat expectations" or "missed targets")
-                - Dividend Announcement (especially with specific rates or dates)
-                - Stock Buyback / Rights Issue
-                - Major Insider Trading (large buy/sell by executives)
-                - A government contract awarded or a major regulatory approval/rejection.
-            - Example: "PT GoTo Gojek Tokopedia (GOTO) reported a 30% revenue jump in its Q2 2025 earnings, significantly beating forecasts. The company also announced a 1 trillion rupiah stock buyback program to boost shareholder value."
-
-            Bonus Criteria for High-Quality News (Additional Points)
-
-            1. Primary CTA (Up to 5 Points Each):
-                Does the article mention any of the following?
-                 - Dividend rate + cum date (+5 points)
-                 - Policy/Bill Passing (especially if it's eyeball-catching) (+5 points)
-                 - Insider trading (especially if it's eyeball-catching) (+5 points)
-                 - Acquisition/Merging (+5 points)
-                 - Launching of a new company business plan (new project/income source/new partner/new contract) (+5 points)
-                 - Earnings Report (+5 points)
-
-            2. Secondary CTA (Up to 2 Points Each):
-                Does the article mention any of the following?
-                 - IDX performance against the US market (+2 points)
-                 - Rupiah performance (+2 points)
-                 - Net foreign buy and sell (+2 points)
-                 - Recommended stocks (stock watchlist) (+2 points)
-                 - Global commodities prices (+2 points)
-                        
-            A high quality news article is one that is:
-                1. actionable
-                2. commercially valuable (request for proposal on a new coal site)
-                3. big movement of money (merger and acquisitions, large insider purchase etc)
-                4. potential big changes for market cap in the industry
-            """
-    
-    def _extract_domain_urlparse(self, url:str):
+        return _DEFAULT_CRITERIA
+
+    def _score_cache_key(self, body: str, article_date: str, article_source: str) -> str:
+        """
+        Build the content-hash cache key for a scoring request.
+
+        Args:
+            body (str): The article content to score
+            article_date (str): The date of the article
+            article_source (str): The source URL of the article
+
+        Returns:
+            str: Hex digest identifying this (date, source, body) triple
+        """
+        raw = f"{article_date}|{article_source}|{body}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _load_score_cache(self) -> Dict[str, int]:
+        """
+        Load the persisted score cache from disk, once.
+
+        Returns:
+            Dict[str, int]: Mapping of content hashes to final scores
+        """
+        if self._score_cache is not None:
+            return self._score_cache
+
+        try:
+            with open("./data/score_cache.json", "r") as f:
+                self._score_cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._score_cache = {}
+
+        return self._score_cache
+
+    def _save_score_cache(self):
+        """Persist the score cache to disk."""
+        with open("./data/score_cache.json", "w") as f:
+            json.dump(self._score_cache, f)
+
+    def _extract_domain_urlparse(self, url: str) -> str:
         """
         Extract domain from URL using urllib.parse (more robust)
-        
+
         Args:
             url (str): Input URL
-            
+
         Returns:
-            str: Domain name or None if invalid
+            str: Domain name, empty string when the URL has no netloc
         """
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc
-        except:
-            return None
+        # urlparse does not raise on bad input, it just leaves netloc empty.
+        # Keep the empty string so manual_score_source lands in its unknown
+        # bucket instead of blowing up on None
+        if not url:
+            return ""
+        return urlparse(url).netloc
 
     def manual_score_time(self, publication_timestamp: str) -> int:
         """
@@ -201,51 +295,27 @@ class ArticleScorer:
             LOGGER.warning(f"Article body is empty or too short for scoring. Returning 0.")
             return 0
 
-        # Get the scoring prompt template
-        template = self.prompts.get_scoring_prompt()
-        
-        # Create a scoring parser using the JsonOutputParser
-        scoring_parser = JsonOutputParser(pydantic_object=ScoringNews)
-        # Prepare the scoring prompt with the template and format instructions
-        scoring_prompt = PromptTemplate(
-            template = template, 
-            input_variables=[
-                "criteria",
-                "body",
-            ],
-            partial_variables={
-                "format_instructions": scoring_parser.get_format_instructions()
-            }
-        )
-
-        # Prepare the scoring system that will handle the article input
-        runnable_scoring_system = RunnableParallel(
-            {   
-                "criteria": itemgetter("criteria"),
-                "body": itemgetter("body"),
-            }
-        )
+        # Skip the LLM entirely for articles we already scored (republished duplicates)
+        cache = self._load_score_cache()
+        cache_key = self._score_cache_key(body, article_date, article_source)
+        if cache_key in cache:
+            LOGGER.info("Score cache hit, skipping LLM scoring call.")
+            return cache[cache_key]
 
-        # Prepare the input data for the LLM
-        # extract_domain = self._extract_domain_urlparse(source)
-        input_data = {"criteria":self._get_default_criteria(), 
-                      "body":body}
+        # Prepare the input data for the LLM, the criteria is baked into the prompt
+        input_data = {"body": body}
 
-        for llm in self.llm_collection.get_llms():
+        for llm in self._health.order(self.llm_collection.get_llms()):
             try:
-                # Create a scoring chain that combines the system, prompt, and LLM
-                scoring_chain = (
-                        runnable_scoring_system
-                        | scoring_prompt
-                        | llm
-                        | scoring_parser
-                    )
-                
+                # Reuse the cached scoring chain for this LLM
+                scoring_chain = self._get_scoring_chain(llm)
+
                 # Process with current LLM
                 result_score_raw = invoke_llm(scoring_chain, input_data)
 
                 # If the wrapper signaled a permanent API failure, just try the next LLM.
                 if result_score_raw is None:
+                    self._health.record_failure(llm)
                     LOGGER.warning("API call failed after all retries, trying next LLM...")
                     continue
                 
@@ -255,13 +325,19 @@ class ArticleScorer:
                 result_score = result_score_raw.get('score', 0)
                 final_score = result_score + score_source_credibilty + score_timeliness
 
-                if 0 <= final_score <= 155:
-                    return final_score
-                else: 
+                if not 0 <= final_score <= 155:
                     LOGGER.warning(
                         f"Score out of range: {final_score}, capping at valid range"
                     )
-                    return max(0, min(155, final_score))
+                    final_score = max(0, min(155, final_score))
+
+                self._health.record_success(llm)
+
+                # Remember the score so duplicates skip the LLM next time
+                cache[cache_key] = final_score
+                self._save_score_cache()
+
+                return final_score
 
             except RateLimitError as error:
                 error_message = str(error).lower()
@@ -270,16 +346,127 @@ class ArticleScorer:
                     continue 
 
             except json.JSONDecodeError as error:
+                self._health.record_failure(llm)
                 LOGGER.error(f"Failed to parse JSON response: {error}")
                 continue
 
             except Exception as error:
+                self._health.record_failure(llm)
                 LOGGER.warning(f"LLM failed with error: {error}")
                 continue
 
         LOGGER.error("All llm failed return None for scoring")
-        return None 
-    
+        return None
+
+    async def get_article_score_async(
+        self, body: str, article_date: str, article_source: str
+    ) -> Optional[int]:
+        """
+        Asynchronously calculate the score for a news article.
+
+        Same behavior as get_article_score, but invokes the cached chains with
+        ainvoke so many articles can be scored concurrently.
+
+        Args:
+            body (str): The article content to score
+            article_date (str): The date of the article in ISO format (YYYY-MM-DD).
+            article_source (str): The source URL of the article
+
+        Returns:
+            Optional[int]: Final score, or None when every LLM failed
+        """
+        # Validation body before goes into llm
+        if not body or len(body.strip()) < 10:
+            LOGGER.warning(f"Article body is empty or too short for scoring. Returning 0.")
+            return 0
+
+        # Skip the LLM entirely for articles we already scored (republished duplicates)
+        cache = self._load_score_cache()
+        cache_key = self._score_cache_key(body, article_date, article_source)
+        if cache_key in cache:
+            LOGGER.info("Score cache hit, skipping LLM scoring call.")
+            return cache[cache_key]
+
+        # Prepare the input data for the LLM, the criteria is baked into the prompt
+        input_data = {"body": body}
+
+        for llm in self._health.order(self.llm_collection.get_llms()):
+            try:
+                # Reuse the cached scoring chain for this LLM
+                scoring_chain = self._get_scoring_chain(llm)
+
+                # Process with current LLM
+                result_score_raw = await invoke_llm_async(scoring_chain, input_data)
+
+                # If the wrapper signaled a permanent API failure, just try the next LLM.
+                if result_score_raw is None:
+                    self._health.record_failure(llm)
+                    LOGGER.warning("API call failed after all retries, trying next LLM...")
+                    continue
+
+                # Final score adding with manual score time and source
+                score_timeliness = self.manual_score_time(article_date)
+                score_source_credibilty = self.manual_score_source(article_source)
+                result_score = result_score_raw.get('score', 0)
+                final_score = result_score + score_source_credibilty + score_timeliness
+
+                if not 0 <= final_score <= 155:
+                    LOGGER.warning(
+                        f"Score out of range: {final_score}, capping at valid range"
+                    )
+                    final_score = max(0, min(155, final_score))
+
+                self._health.record_success(llm)
+
+                # Remember the score so duplicates skip the LLM next time
+                cache[cache_key] = final_score
+                self._save_score_cache()
+
+                return final_score
+
+            except RateLimitError as error:
+                error_message = str(error).lower()
+                if "tokens per day" in error_message or "tpd" in error_message:
+                    LOGGER.warning(f"LLM: {llm.model_name} hit its daily token limit. Moving to next LLM.")
+                    continue
+
+            except json.JSONDecodeError as error:
+                self._health.record_failure(llm)
+                LOGGER.error(f"Failed to parse JSON response: {error}")
+                continue
+
+            except Exception as error:
+                self._health.record_failure(llm)
+                LOGGER.warning(f"LLM failed with error: {error}")
+                continue
+
+        LOGGER.error("All llm failed return None for scoring")
+        return None
+
+    async def score_many(
+        self, items: List[Tuple[str, str, str]], concurrency: int = 5
+    ) -> List[Optional[int]]:
+        """
+        Score many articles concurrently with a bounded semaphore.
+
+        Args:
+            items (List[Tuple[str, str, str]]): List of (body, article_date,
+                article_source) tuples
+            concurrency (int): Max scoring calls in flight at once
+
+        Returns:
+            List[Optional[int]]: One score per item, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _score_one(body: str, article_date: str, article_source: str):
+            async with semaphore:
+                return await self.get_article_score_async(body, article_date, article_source)
+
+        return await asyncio.gather(
+            *[_score_one(body, date, source) for body, date, source in items]
+        )
+
 
 # So we can use the scorer as a singleton
 _SCORER = ArticleScorer()
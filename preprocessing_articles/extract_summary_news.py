@@ -2,31 +2,30 @@
 Script to use LLM for summarizing a news article, uses Llama Groq
 """
 
-from bs4                            import BeautifulSoup
-from nltk.tokenize                  import sent_tokenize, word_tokenize
-from goose3                         import Goose
 from requests                       import Response, Session
+from requests.adapters              import HTTPAdapter, Retry
 from langchain_core.output_parsers  import JsonOutputParser
 from langchain.prompts              import PromptTemplate
 from langchain_core.runnables       import RunnableParallel
 from operator                       import itemgetter
+from functools                      import lru_cache
 from groq                           import RateLimitError
 
-from llm_models.get_models  import LLMCollection, invoke_llm
+from llm_models.get_models  import LLMCollection, LLMHealthTracker, invoke_llm, invoke_llm_async
 from llm_models.llm_prompts import ClassifierPrompts, SummaryNews
 from config.setup           import LOGGER
 
+import aiohttp
+import asyncio
 import requests
+import orjson
 import os
 import re
-import nltk
-import json 
-import cloudscraper
-import time 
-import random 
-
-# NLTK download
-nltk.data.path.append("./nltk_data")
+import json
+import time
+import random
+import hashlib
+import sqlite3
 
 
 USER_AGENT = "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Mobile Safari/537.36"
@@ -47,6 +46,270 @@ HEADERS = {
 LLMCOLLECTION = LLMCollection()
 PROMPTS = ClassifierPrompts()
 
+# Circuit breaker shared by the summarize paths, a provider that keeps
+# failing is skipped with an exponentially growing cooldown
+_HEALTH = LLMHealthTracker()
+
+# Pattern grabbing the JSON object out of the raw LLM output
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.S)
+
+
+class FastJsonOutputParser(JsonOutputParser):
+    """
+    JsonOutputParser that decodes the LLM output with orjson instead of the
+    stdlib json module. Falls back to the stock langchain parser when no
+    clean JSON block can be found or decoded.
+    """
+
+    # parse_result (not parse) is what the chain path invokes on model output
+    def parse_result(self, result, *, partial: bool = False) -> dict:
+        match = _JSON_BLOCK_RE.search(result[0].text)
+        if match:
+            try:
+                return orjson.loads(match.group())
+            except orjson.JSONDecodeError:
+                pass
+        return super().parse_result(result, partial=partial)
+
+
+# The summary parser, format instructions, and prompt depend only on the
+# static SummaryNews schema, build them once at import instead of per call
+_SUMMARY_PARSER = FastJsonOutputParser(pydantic_object=SummaryNews)
+_SUMMARY_FORMAT_INSTRUCTIONS = _SUMMARY_PARSER.get_format_instructions()
+_SUMMARY_PROMPT = PromptTemplate(
+    template=PROMPTS.get_summarize_prompt(),
+    input_variables=["article"],
+    partial_variables={
+        "format_instructions": _SUMMARY_FORMAT_INSTRUCTIONS
+    }
+)
+_SUMMARY_RUNNABLE = RunnableParallel(
+        {
+            "article": itemgetter("article")
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_summary_chains():
+    """
+    Build one summary chain per LLM a single time. The | operator allocates
+    and validates a RunnableSequence, so rebuilding chains inside the retry
+    loop on every call is pure waste.
+
+    Returns:
+        list: (llm, chain) pairs in collection order.
+    """
+    return [
+        (llm, _SUMMARY_RUNNABLE | _SUMMARY_PROMPT | llm | _SUMMARY_PARSER)
+        for llm in LLMCOLLECTION.get_llms()
+    ]
+
+
+def _healthy_summary_chains():
+    """
+    Return the pre-built (llm, chain) pairs with breaker-tripped models
+    skipped and the last known-good model first.
+
+    Returns:
+        list: (llm, chain) pairs in health-preference order.
+    """
+    chain_map = {id(llm): chain for llm, chain in _get_summary_chains()}
+    ordered = _HEALTH.order([llm for llm, _ in _get_summary_chains()])
+    return [(llm, chain_map[id(llm)]) for llm in ordered]
+
+# Shared HTTP session and Goose instances, built once at import so repeated
+# article fetches reuse pooled connections instead of paying a fresh TCP+TLS
+# handshake and Goose re-initialization per call
+_PROXY = os.environ.get("PROXY")
+
+_SESSION = Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.proxies.update({
+    "http": _PROXY,
+    "https": _PROXY,
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+@lru_cache(maxsize=1)
+def _get_goose():
+    """Lazily import goose3 and build the proxied Goose over the shared session."""
+    from goose3 import Goose
+    return Goose({"http_session": _SESSION})
+
+
+@lru_cache(maxsize=1)
+def _get_goose_noproxy():
+    """Lazily build the no-proxy Goose used as last-resort fallback."""
+    from goose3 import Goose
+    return Goose()
+
+
+@lru_cache(maxsize=1)
+def _get_goose_cloudscraper():
+    """Lazily build the cloudscraper-backed Goose for Cloudflare-protected hosts."""
+    import cloudscraper
+    from goose3 import Goose
+    scraper = cloudscraper.create_scraper()
+    return Goose({"browser_user_agent": USER_AGENT, "http_session": scraper})
+
+# Pre-compiled patterns and stopwords for preprocess_text, built once at
+# import instead of per call
+_PAREN_RE = re.compile(r"\(.*?\)")
+_TOKEN_RE = re.compile(r"[A-Za-z0-9']+")
+_PUNCT_SPACE_RE = re.compile(r'\s+([?.!,"])')
+_WS_RE = re.compile(r"\s+")
+_STOP_WORDS = frozenset((
+    "a", "an", "the", "with", "of", "to", "and", "in", "on", "for", "as", "by",
+))
+
+# The summary is capped at two sentences, nothing downstream uses the tail of
+# a long article, so per-article work is bounded to this prefix
+_MAX_CHARS = 6000
+
+
+def _truncate_text(news_text: str, limit: int = _MAX_CHARS) -> str:
+    """
+    Truncate the article to a bounded prefix, cutting on the last sentence
+    boundary before the limit when one exists.
+
+    Args:
+        news_text (str): The article text to be truncated.
+        limit (int): Maximum number of characters to keep.
+
+    Returns:
+        str: The truncated article text.
+    """
+    if len(news_text) <= limit:
+        return news_text
+
+    boundary = news_text.rfind(".", 0, limit)
+    if boundary > 0:
+        return news_text[:boundary + 1]
+    return news_text[:limit]
+
+# Disk-backed caches: summaries keyed by the article body hash so re-running
+# the pipeline over the same wire story skips the paid LLM call, and extracted
+# article bodies keyed by the url hash so hourly incremental runs skip the
+# fetch and Goose pass for urls already seen
+_CACHE_PATH = "./data/scraper_cache.db"
+_SUMMARY_CACHE_TTL = 7 * 24 * 3600
+_ARTICLE_CACHE_TTL = 24 * 3600
+_cache_conn = None
+
+
+def _get_cache_conn() -> sqlite3.Connection:
+    """
+    Lazily open the SQLite scraper cache, creating the tables on first use.
+
+    Returns:
+        sqlite3.Connection: The shared cache connection.
+    """
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        _cache_conn = sqlite3.connect(_CACHE_PATH, check_same_thread=False)
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, title TEXT, body TEXT, ts INT)"
+        )
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles (key TEXT PRIMARY KEY, body TEXT, ts INT)"
+        )
+    return _cache_conn
+
+
+def _article_cache_get(url: str) -> str:
+    """
+    Look up a previously extracted article body for a url.
+
+    Args:
+        url (str): The URL of the article.
+
+    Returns:
+        str: The cached article body, or None on a miss.
+    """
+    try:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        row = _get_cache_conn().execute(
+            "SELECT body FROM articles WHERE key = ? AND ts > ?",
+            (key, int(time.time()) - _ARTICLE_CACHE_TTL),
+        ).fetchone()
+        if row:
+            return row[0]
+    except Exception as error:
+        LOGGER.warning(f"Article cache lookup failed: {error}")
+    return None
+
+
+def _article_cache_set(url: str, body: str) -> None:
+    """
+    Store an extracted article body under the hash of its url.
+
+    Args:
+        url (str): The URL of the article.
+        body (str): The extracted article text.
+    """
+    try:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        conn = _get_cache_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO articles (key, body, ts) VALUES (?, ?, ?)",
+            (key, body, int(time.time())),
+        )
+        conn.commit()
+    except Exception as error:
+        LOGGER.warning(f"Article cache write failed: {error}")
+
+
+def _summary_cache_get(body: str) -> dict[str]:
+    """
+    Look up a previously generated summary for an identical article body.
+
+    Args:
+        body (str): The article text the summary was generated from.
+
+    Returns:
+        dict[str]: The cached title and body, or None on a miss.
+    """
+    try:
+        key = hashlib.sha256(body.encode()).hexdigest()
+        row = _get_cache_conn().execute(
+            "SELECT title, body FROM summaries WHERE key = ? AND ts > ?",
+            (key, int(time.time()) - _SUMMARY_CACHE_TTL),
+        ).fetchone()
+        if row:
+            return {"title": row[0], "body": row[1]}
+    except Exception as error:
+        LOGGER.warning(f"Summary cache lookup failed: {error}")
+    return None
+
+
+def _summary_cache_set(body: str, summary: dict) -> None:
+    """
+    Store a generated summary under the hash of its article body.
+
+    Args:
+        body (str): The article text the summary was generated from.
+        summary (dict): The title and body returned by the LLM.
+    """
+    try:
+        key = hashlib.sha256(body.encode()).hexdigest()
+        conn = _get_cache_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO summaries (key, title, body, ts) VALUES (?, ?, ?, ?)",
+            (key, summary.get("title"), summary.get("body"), int(time.time())),
+        )
+        conn.commit()
+    except Exception as error:
+        LOGGER.warning(f"Summary cache write failed: {error}")
+
 
 def summarize_article(body: str, url: str) -> dict[str]:
     """ 
@@ -58,73 +321,206 @@ def summarize_article(body: str, url: str) -> dict[str]:
     Returns:
         dict[str]: A dictionary containing the title and body of the summary.
     """
-    # Get the prompt template for summarization
-    template = PROMPTS.get_summarize_prompt()
-
-    # Create a summary parser using the JsonOutputParser
-    summary_parser = JsonOutputParser(pydantic_object=SummaryNews)
-    # Prepare the prompt with the template and format instructions
-    summary_prompt = PromptTemplate(
-        template=template, 
-        input_variables=["article"],
-        partial_variables={
-            "format_instructions": summary_parser.get_format_instructions()
-        }
-    )
-
-    # Create a runnable system that will handle the article input
-    runnable_summary_system = RunnableParallel(
-            {   
-                "article": itemgetter("article")
-            }
-        )
+    # Identical article bodies (republished wire stories, re-runs) are served
+    # from the cache without paying another LLM call
+    cached_summary = _summary_cache_get(body)
+    if cached_summary is not None:
+        LOGGER.info(f"[CACHE HIT] Summary served from cache for url: {url}")
+        return cached_summary
 
     # Prepare the input data for the LLM
     input_data = {"article": body}
-    
-    for llm in LLMCOLLECTION.get_llms():
+
+    for llm, summary_chain in _healthy_summary_chains():
         try:
-            # Create a summary chain that combines the system, prompt, and LLM
-            summary_chain = (
-                runnable_summary_system
-                | summary_prompt
-                | llm 
-                | summary_parser
-            )
-            
             summary_result = invoke_llm(summary_chain, input_data)
             if summary_result is None:
                 LOGGER.warning("API call failed after all retries, trying next LLM...")
+                _HEALTH.record_failure(llm)
                 continue
 
             if not summary_result.get("title") or not summary_result.get("body"):
                 LOGGER.info("[ERROR] LLM returned incomplete summary_result")
                 continue
-            
+
             LOGGER.info(f"[SUCCES] Summarize for url: {url}")
+            _HEALTH.record_success(llm)
+            _summary_cache_set(body, summary_result)
             return summary_result
 
         except RateLimitError as error:
             error_message = str(error).lower()
+            _HEALTH.record_failure(llm)
             if "tokens per day" in error_message or "tpd" in error_message:
                 LOGGER.warning(f"LLM: {llm.model_name} hit its daily token limit. Moving to next LLM")
-                continue 
+                continue
 
         except json.JSONDecodeError as error:
             LOGGER.error(f"Failed to parse JSON response: {error}, trying next LLM...")
             continue
-            
+
         except Exception as error:
             LOGGER.warning(f"LLM failed with error: {error}")
-            continue 
+            _HEALTH.record_failure(llm)
+            continue
 
     LOGGER.error("All LLMs failed to return a valid summary.")
     return None
 
 
+async def summarize_article_async(body: str, url: str, hedge: int = 3) -> dict[str]:
+    """
+    Async variant of summarize_article, invokes the LLM chain with ainvoke so
+    many articles can be summarized concurrently. The LLMs are raced in groups
+    of `hedge` so one slow or stuck provider does not serialize the whole
+    retry walk; the first complete summary wins and the losers are cancelled.
+
+    Args:
+        body (str): The text of the article to be summarized.
+        url (str): The URL of the article, used for logging.
+        hedge (int): Number of LLMs to race concurrently per group.
+
+    Returns:
+        dict[str]: A dictionary containing the title and body of the summary.
+    """
+    cached_summary = _summary_cache_get(body)
+    if cached_summary is not None:
+        LOGGER.info(f"[CACHE HIT] Summary served from cache for url: {url}")
+        return cached_summary
+
+    # Prepare the input data for the LLM
+    input_data = {"article": body}
+
+    async def invoke_one(summary_chain) -> dict[str]:
+        return await invoke_llm_async(summary_chain, input_data)
+
+    chains = _healthy_summary_chains()
+
+    # Race the LLMs in hedged groups, first valid summary wins
+    for start in range(0, len(chains), hedge):
+        group = chains[start:start + hedge]
+        tasks = {
+            asyncio.ensure_future(invoke_one(summary_chain)): llm
+            for llm, summary_chain in group
+        }
+        pending = set(tasks)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                llm = tasks[task]
+                try:
+                    summary_result = task.result()
+
+                except RateLimitError as error:
+                    error_message = str(error).lower()
+                    _HEALTH.record_failure(llm)
+                    if "tokens per day" in error_message or "tpd" in error_message:
+                        LOGGER.warning(f"LLM: {llm.model_name} hit its daily token limit. Moving to next LLM")
+                    continue
+
+                except json.JSONDecodeError as error:
+                    LOGGER.error(f"Failed to parse JSON response: {error}, trying next LLM...")
+                    continue
+
+                except Exception as error:
+                    LOGGER.warning(f"LLM failed with error: {error}")
+                    _HEALTH.record_failure(llm)
+                    continue
+
+                if summary_result is None:
+                    LOGGER.warning("API call failed after all retries, trying next LLM...")
+                    _HEALTH.record_failure(llm)
+                    continue
+
+                if not summary_result.get("title") or not summary_result.get("body"):
+                    LOGGER.info("[ERROR] LLM returned incomplete summary_result")
+                    continue
+
+                # Got a valid summary, cancel the losing hedges
+                for losing_task in pending:
+                    losing_task.cancel()
+
+                LOGGER.info(f"[SUCCES] Summarize for url: {url}")
+                _HEALTH.record_success(llm)
+                _summary_cache_set(body, summary_result)
+                return summary_result
+
+    LOGGER.error("All LLMs failed to return a valid summary.")
+    return None
+
+
+def summarize_article_many(bodies: list[str]) -> list[dict]:
+    """
+    Summarize many article bodies in one batched LLM round via chain.batch,
+    instead of paying one invoke round-trip per article. Articles that fail
+    on one LLM fall through to the next LLM for their indices only.
+
+    Args:
+        bodies (list[str]): The article texts to be summarized.
+
+    Returns:
+        list[dict]: One summary per body, None where every LLM failed.
+    """
+    results = [None] * len(bodies)
+
+    # Serve exact duplicates and re-runs from the summary cache first
+    pending_indices = []
+    for index, body in enumerate(bodies):
+        cached_summary = _summary_cache_get(body)
+        if cached_summary is not None:
+            results[index] = cached_summary
+        else:
+            pending_indices.append(index)
+
+    for llm, summary_chain in _healthy_summary_chains():
+        if not pending_indices:
+            break
+
+        input_batch = [{"article": bodies[index]} for index in pending_indices]
+
+        try:
+            batch_results = summary_chain.batch(
+                input_batch,
+                config={"max_concurrency": 16},
+                return_exceptions=True,
+            )
+        except Exception as error:
+            LOGGER.warning(f"Batch summarization failed with error: {error}, trying next LLM...")
+            _HEALTH.record_failure(llm)
+            continue
+
+        # Keep only the indices that still need another LLM
+        still_pending = []
+        for index, summary_result in zip(pending_indices, batch_results):
+            if isinstance(summary_result, Exception) or summary_result is None:
+                still_pending.append(index)
+                continue
+
+            if not summary_result.get("title") or not summary_result.get("body"):
+                still_pending.append(index)
+                continue
+
+            results[index] = summary_result
+            _summary_cache_set(bodies[index], summary_result)
+
+        if len(still_pending) < len(pending_indices):
+            _HEALTH.record_success(llm)
+        else:
+            _HEALTH.record_failure(llm)
+
+        pending_indices = still_pending
+
+    if pending_indices:
+        LOGGER.error(f"All LLMs failed to summarize {len(pending_indices)} articles in the batch.")
+
+    return results
+
+
 def preprocess_text(news_text: str) -> str:
     """ 
-    Preprocesses the news text by removing parenthesis, tokenizing sentences and words,
+    Preprocesses the news text by removing parenthesis, tokenizing words,
     removing stopwords, and formatting the text.
 
     Args:
@@ -133,43 +529,29 @@ def preprocess_text(news_text: str) -> str:
     Returns:
         str: The preprocessed text ready for summarization.
     """
+    # Bound per-article CPU before tokenizing
+    news_text = news_text[:_MAX_CHARS]
+
     # Remove parenthesis
-    news_text = re.sub(r"\(.*?\)", "", news_text)
-
-    # Tokenize into sentences
-    sentences = sent_tokenize(news_text)
-
-    # Tokenize into words, remove stopwords, and convert to lowercase
-    stop_words = {
-        "a",
-        "an",
-        "the",
-        "with",
-        "of",
-        "to",
-        "and",
-        "in",
-        "on",
-        "for",
-        "as",
-        "by",
-    }
-    words = [word_tokenize(sentence) for sentence in sentences]
+    news_text = _PAREN_RE.sub("", news_text)
+
+    # Lowercase the whole buffer in one C-level pass instead of per token
+    news_text = news_text.casefold()
+
+    # Tokenize into words and remove stopwords in a single regex pass
     words = [
-        [word.lower() for word in sentence if word.lower() not in stop_words]
-        for sentence in words
+        word
+        for word in _TOKEN_RE.findall(news_text)
+        if word not in _STOP_WORDS
     ]
 
-    # Combine words back into sentences
-    processed_sentences = [" ".join(sentence) for sentence in words]
-
-    # Combine sentences back into a single string
-    processed_text = " ".join(processed_sentences)
+    # Combine words back into a single string
+    processed_text = " ".join(words)
 
     # Remove spaces before punctuation
-    processed_text = re.sub(r'\s+([?.!,"])', r"\1", processed_text)
+    processed_text = _PUNCT_SPACE_RE.sub(r"\1", processed_text)
     # Remove multiple spaces
-    processed_text = re.sub(r"\s+", " ", processed_text)
+    processed_text = _WS_RE.sub(" ", processed_text)
 
     return processed_text
 
@@ -184,33 +566,42 @@ def get_article_body(url: str) -> str:
     Returns:
         str: The cleaned text of the article body. If extraction fails, returns an empty string
     """
-    # First attempt try to get full article with goose3 proxy and soup as fallback
+    # Urls extracted recently are served from the disk cache without touching
+    # the network, common when incremental runs revisit the same listings
+    cached_body = _article_cache_get(url)
+    if cached_body is not None:
+        print(f"[CACHE HIT] Article body served from cache for url {url}")
+        return cached_body
+
+    # First attempt fetch the HTML once over the shared session, then hand the
+    # bytes to goose3 with soup as fallback on the same bytes
     try:
-        proxy = os.environ.get("PROXY")
-        proxy_support = {"http": proxy, "https": proxy}
-
-        session = Session()
-        session.proxies.update(proxy_support)
-        session.headers.update(HEADERS)
-
-        # g = Goose({'http_proxies': proxy_support, 'https_proxies': proxy_support})
-        g = Goose({"http_session": session})
-        article = g.extract(url=url)
+        response: Response = _SESSION.get(url, timeout=15)
+        response.raise_for_status()
+        html = response.content
+
+        # Hand the raw bytes to goose3 so it does its own charset detection,
+        # requests claims ISO-8859-1 for text/html responses that lack a
+        # charset header and would mojibake UTF-8 pages
+        article = _get_goose().extract(raw_html=html)
         print(f"[SUCCESS] Article from url {url} inferenced")
 
         if article.cleaned_text:
+            _article_cache_set(url, article.cleaned_text)
             return article.cleaned_text
         else:
-            # If fail, get the HTML and extract the text
+            # If fail, reuse the already-downloaded HTML to extract the text
             print("[REQUEST FAIL] Goose3 returned empty string, trying with soup")
-            response: Response = requests.get(url)
-            response.raise_for_status()
+            from bs4 import BeautifulSoup
 
-            soup: BeautifulSoup = BeautifulSoup(response.content, "html.parser")
-            content: BeautifulSoup = soup.find("div", class_="content")
+            soup: BeautifulSoup = BeautifulSoup(html, "lxml")
+            content: BeautifulSoup = soup.find("div", class_="content") or soup.find("article") or soup.body
             print(f"[SUCCESS] Article inferenced from url {url} using soup")
-            return content.get_text()
-        
+            body_text = content.get_text(" ", strip=True) if content else ""
+            if body_text:
+                _article_cache_set(url, body_text)
+            return body_text
+
     except Exception as error:
         print(
             f"[PROXY FAIL] Goose3 failed with error {error} for url {url}"
@@ -220,13 +611,11 @@ def get_article_body(url: str) -> str:
     try:
         print("[FALLBACK] Attempt 2: Trying with cloudscraper...")
 
-        scraper = cloudscraper.create_scraper() 
-        g = Goose({'browser_user_agent': USER_AGENT, 'http_session': scraper})
-
-        article = g.extract(url=url)
+        article = _get_goose_cloudscraper().extract(url=url)
         if article.cleaned_text:
             print(f"[SUCCESS] Extracted using cloudscraper for url {url}.")
 
+            _article_cache_set(url, article.cleaned_text)
             return article.cleaned_text
         
     except Exception as error:
@@ -236,10 +625,11 @@ def get_article_body(url: str) -> str:
     try:
         print("[FALLBACK] Attempt 3: Trying with no PROXY...")
 
-        g = Goose()
-        article = g.extract(url=url)
+        article = _get_goose_noproxy().extract(url=url)
 
         print(f"[SUCCESS] Article inferenced from url {url} with no PROXY")
+        if article.cleaned_text:
+            _article_cache_set(url, article.cleaned_text)
         return article.cleaned_text
     
     except Exception as error:
@@ -265,7 +655,10 @@ def summarize_news(url: str) -> tuple[str, str]:
         LOGGER.info(f"Check full article content: {news_text[:550]}")
         
         if len(news_text) > 0:
-            news_text = preprocess_text(news_text)
+            # The LLM handles casing, punctuation and stopwords natively, so
+            # skip preprocess_text and just collapse whitespace and bound the
+            # prompt size. preprocess_text stays available for offline callers.
+            news_text = _WS_RE.sub(" ", _truncate_text(news_text)).strip()
 
             # Summarize the article and force to sleep 5s
             response = summarize_article(news_text, url)
@@ -284,6 +677,108 @@ def summarize_news(url: str) -> tuple[str, str]:
         return None
 
 
+async def get_article_body_async(session: "aiohttp.ClientSession", url: str) -> str:
+    """
+    Async variant of get_article_body, fetches the HTML over a shared aiohttp
+    session and hands the CPU-bound Goose3 parsing to an executor thread so
+    the event loop stays free for other fetches.
+
+    Args:
+        session (aiohttp.ClientSession): Shared session for the batch.
+        url (str): The URL of the article to be extracted.
+
+    Returns:
+        str: The cleaned text of the article body. If extraction fails, returns an empty string
+    """
+    cached_body = _article_cache_get(url)
+    if cached_body is not None:
+        LOGGER.info(f"[CACHE HIT] Article body served from cache for url {url}")
+        return cached_body
+
+    try:
+        async with session.get(url, headers=HEADERS, proxy=_PROXY) as response:
+            response.raise_for_status()
+            html = await response.text()
+    except Exception as error:
+        LOGGER.error(f"[ERROR] Async fetch failed for url {url} with error: {error}")
+        return ""
+
+    # Goose parsing is CPU-bound lxml work, keep it off the event loop
+    loop = asyncio.get_running_loop()
+
+    def _extract() -> str:
+        article = _get_goose_noproxy().extract(raw_html=html)
+        return article.cleaned_text or ""
+
+    try:
+        body_text = await loop.run_in_executor(None, _extract)
+        if body_text:
+            _article_cache_set(url, body_text)
+        return body_text
+    except Exception as error:
+        LOGGER.error(f"[ERROR] Goose3 failed parsing HTML for url {url} with error: {error}")
+        return ""
+
+
+async def summarize_news_async(session: "aiohttp.ClientSession", url: str) -> tuple[str, str]:
+    """
+    Async variant of summarize_news for batch runs, fetches and summarizes a
+    single article without the fixed sleeps of the sync path.
+
+    Args:
+        session (aiohttp.ClientSession): Shared session for the batch.
+        url (str): The URL of the news article to be summarized.
+
+    Returns:
+        tuple[str, str]: A tuple containing the title and body of the summarized article.
+    """
+    try:
+        news_text = await get_article_body_async(session, url)
+        LOGGER.info(f"Check full article content: {news_text[:550]}")
+
+        if len(news_text) > 0:
+            news_text = _WS_RE.sub(" ", _truncate_text(news_text)).strip()
+
+            response = await summarize_article_async(news_text, url)
+
+            if not response or not response.get("body"):
+                LOGGER.error(f"Summarization LLM call failed or returned incomplete data for {url}.")
+                return None
+
+            return response.get("title"), response.get("body")
+        else:
+            LOGGER.warning(f"Scraper returned empty content for {url}. Failing summarization.")
+            return None
+    except Exception as error:
+        LOGGER.error(f"An unexpected error occurred in summarize_news_async for {url}: {error}")
+        return None
+
+
+async def summarize_news_batch(urls: list[str], concurrency: int = 100) -> list[tuple[str, str]]:
+    """
+    Summarize many news articles concurrently. Fetches run over one pooled
+    aiohttp connector and LLM calls go through ainvoke, so the wall-clock cost
+    is bounded by the slowest article instead of the sum of all of them.
+
+    Args:
+        urls (list[str]): The URLs of the news articles to be summarized.
+        concurrency (int): Maximum number of articles in flight at once.
+
+    Returns:
+        list[tuple[str, str]]: One (title, body) tuple per url, None for failures.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=200, ttl_dns_cache=300)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def bounded_summarize(url: str):
+            async with semaphore:
+                return await summarize_news_async(session, url)
+
+        return await asyncio.gather(*[bounded_summarize(url) for url in urls])
+
+
 # urls = [
 #     "https://www.idnfinancials.com/news/50366/boosting-growth-tpma-acquires-worth-us",
 #     "https://www.idnfinancials.com/news/50438/consistent-profit-dividend-ptba-rakes-indeks-categories",